@@ -22,6 +22,7 @@ Installation:
   $ sudo pip install psutil smbus2
 """
 
+import itertools
 import time
 import psutil
 
@@ -31,38 +32,19 @@ from luma.core.virtual import viewport, snapshot
 from hotspot import memory, uptime, cpu_load, clock, network, disk, ups_battery
 
 
-def position(max, step=1):
-    forwards = range(0, max, step)
-    backwards = range(max, 0, -step)
-    while True:
-        for x in forwards:
-            yield x
-        for x in backwards:
-            yield x
-
-
-def pause_every(interval, generator):
-    try:
-        while True:
-            x = next(generator)
-            if x % interval == 0:
-                for _ in range(20):
-                    yield x
-            else:
-                yield x
-    except StopIteration:
-        pass
-
-
-def intersect(a, b):
-    return list(set(a) & set(b))
-
-
-def first(iterable, default=None):
-    if iterable:
-        for item in iterable:
-            return item
-    return default
+def sweep(max, step=1, interval=None, pause=20):
+    """
+    Precompute one forwards-and-back pass of scroll positions, holding
+    each multiple of interval for pause frames, so the frame loop only
+    has to cycle over a flat list.
+    """
+    positions = []
+    for x in itertools.chain(range(0, max, step), range(max, 0, -step)):
+        if interval and x % interval == 0:
+            positions.extend([x] * pause)
+        else:
+            positions.append(x)
+    return positions
 
 
 def main():
@@ -70,25 +52,26 @@ def main():
     widget_width = device.width
     widget_height = device.height
 
-    # Create hotspot widgets with faster refresh intervals
-    utime = snapshot(widget_width, widget_height, uptime.render, interval=0.5)
-    mem = snapshot(widget_width, widget_height, memory.render, interval=0.5)
-    dsk = snapshot(widget_width, widget_height, disk.render, interval=1.0)
+    # Create hotspot widgets with faster refresh intervals, staggered
+    # slightly so that their redraws don't all fall on the same frame
+    utime = snapshot(widget_width, widget_height, uptime.render, interval=0.53)
+    mem = snapshot(widget_width, widget_height, memory.render, interval=0.51)
+    dsk = snapshot(widget_width, widget_height, disk.render, interval=1.07)
     cpuload = snapshot(widget_width, widget_height, cpu_load.render, interval=0.25)
     clk = snapshot(widget_width, widget_height, clock.render, interval=0.5)
 
     # UPS battery monitoring widget
-    ups = snapshot(widget_width, widget_height, ups_battery.render, interval=1.0)
+    ups = ups_battery.UPSBattery(widget_width, widget_height, interval=1.02)
 
     # Network interfaces detection
-    network_ifs = psutil.net_if_stats().keys()
-    wlan = first(intersect(network_ifs, ["wlan0", "wl0"]), "wlan0")
-    eth = first(intersect(network_ifs, ["eth0", "en0"]), "eth0")
-    lo = first(intersect(network_ifs, ["lo", "lo0"]), "lo")
+    network_ifs = frozenset(psutil.net_if_stats())
+    wlan = next((n for n in ("wlan0", "wl0") if n in network_ifs), "wlan0")
+    eth = next((n for n in ("eth0", "en0") if n in network_ifs), "eth0")
+    lo = next((n for n in ("lo", "lo0") if n in network_ifs), "lo")
 
-    net_wlan = snapshot(widget_width, widget_height, network.stats(wlan), interval=1.0)
-    net_eth = snapshot(widget_width, widget_height, network.stats(eth), interval=1.0)
-    net_lo = snapshot(widget_width, widget_height, network.stats(lo), interval=1.0)
+    net_wlan = snapshot(widget_width, widget_height, network.stats(wlan), interval=1.03)
+    net_eth = snapshot(widget_width, widget_height, network.stats(eth), interval=1.04)
+    net_lo = snapshot(widget_width, widget_height, network.stats(lo), interval=1.05)
 
     # Widget list including UPS battery
     widgets = [cpuload, ups, utime, clk, net_wlan, net_eth, net_lo, mem, dsk]
@@ -97,21 +80,41 @@ def main():
     target_fps = 120
     frame_time = 1.0 / target_fps
 
+    # While paused on a widget nothing moves, so refresh at a quarter of
+    # the scrolling rate (5 slow frames last about as long as 20 fast ones)
+    pause_slowdown = 4
+    pause_frames = 5
+
     # Horizontal scrolling (full screen widgets)
     virtual = viewport(device, width=widget_width * len(widgets), height=widget_height)
     for i, widget in enumerate(widgets):
         virtual.add_hotspot(widget, (i * widget_width, 0))
 
     scroll_speed = 2  # Pixels per frame for faster scrolling
-    for x in pause_every(widget_width, position(widget_width * (len(widgets) - 1), scroll_speed)):
-        frame_start = time.time()
-        virtual.set_position((x, 0))
-
-        # Sleep only for remaining frame time to maintain consistent FPS
-        elapsed = time.time() - frame_start
-        sleep_time = frame_time - elapsed
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+    deadline = time.monotonic()
+    last_x = None
+    positions = sweep(widget_width * (len(widgets) - 1), scroll_speed,
+                      interval=widget_width, pause=pause_frames)
+    for x in itertools.cycle(positions):
+        if x != last_x:
+            virtual.set_position((x, 0))
+            last_x = x
+            deadline += frame_time
+        else:
+            # Position unchanged: only repaint hotspots that are due, which
+            # skips pushing an identical frame to the device
+            virtual.refresh()
+            deadline += frame_time * pause_slowdown
+
+        # Sleep until the next frame deadline; scheduling against fixed
+        # deadlines (rather than per-frame elapsed time) absorbs oversleep
+        # instead of letting it accumulate as drift
+        now = time.monotonic()
+        if deadline < now:
+            # Running late: drop the missed frames rather than trying to catch up
+            deadline = now
+        else:
+            time.sleep(deadline - now)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2014-18 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Shared background collector for hotspot statistics.
+A single daemon thread gathers the psutil readings (plus any other
+registered sources, such as the UPS), each at its own cadence, and
+publishes them as one snapshot dict, so the render functions only do
+dictionary lookups on the animation loop.
+"""
+
+import functools
+import threading
+import time
+import psutil
+
+
+INTERVAL = 0.25  # Seconds between collections
+
+# Readings as name -> (function, refresh interval in seconds)
+_sources = {}
+_last_read = {}
+
+_snapshot = None
+_thread = None
+_lock = threading.Lock()
+
+
+def register(name, fn, interval=INTERVAL):
+    """Add a reading to the snapshot, refreshed every interval seconds."""
+    _sources[name] = (fn, interval)
+
+
+# Built-in readings, each at the slowest rate the hotspots refresh it
+register("cpu", functools.partial(psutil.cpu_percent, interval=None, percpu=True), 0.25)
+register("mem", psutil.virtual_memory, 0.5)
+register("swap", psutil.swap_memory, 0.5)
+register("disk", functools.partial(psutil.disk_usage, "/"), 1.0)
+register("net_addrs", psutil.net_if_addrs, 1.0)
+register("net_io", functools.partial(psutil.net_io_counters, pernic=True), 1.0)
+
+
+def _collect(previous):
+    now = time.monotonic()
+    stats = {}
+
+    for name, (fn, interval) in list(_sources.items()):
+        if name in previous and now - _last_read[name] < interval:
+            stats[name] = previous[name]
+            continue
+
+        _last_read[name] = now
+        try:
+            stats[name] = fn()
+        except Exception:
+            # Keep showing the last good value rather than losing the reading
+            if name in previous:
+                stats[name] = previous[name]
+
+    return stats
+
+
+def _collect_loop():
+    global _snapshot
+
+    while True:
+        time.sleep(INTERVAL)
+        # Publish with a single reference swap, so readers never see
+        # a partially built snapshot
+        _snapshot = _collect(_snapshot)
+
+
+def latest():
+    """
+    Return the most recent statistics snapshot. The first call takes
+    a reading synchronously and starts the background collector.
+    """
+    global _snapshot, _thread
+
+    if _thread is None:
+        with _lock:
+            if _thread is None:
+                _snapshot = _collect({})
+                _thread = threading.Thread(target=_collect_loop, name="hotspot-collector", daemon=True)
+                _thread.start()
+
+    return _snapshot
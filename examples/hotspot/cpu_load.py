@@ -4,8 +4,8 @@
 # See LICENSE.rst for details.
 
 import time
-import psutil
 from luma.core.virtual import hotspot
+from hotspot import collector
 from hotspot.common import title_text
 
 
@@ -15,7 +15,7 @@ def vertical_bar(draw, x1, y1, x2, y2, yh):
 
 
 def render(draw, width, height):
-    percentages = psutil.cpu_percent(interval=None, percpu=True)
+    percentages = collector.latest()["cpu"]
 
     top_margin = 3
     bottom_margin = 3
@@ -3,12 +3,12 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
-import psutil
+from hotspot import collector
 from hotspot.common import bytes2human, right_text, title_text, tiny_font
 
 
 def render(draw, width, height):
-    df = psutil.disk_usage("/")
+    df = collector.latest()["disk"]
 
     margin = 3
 
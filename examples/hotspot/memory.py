@@ -3,13 +3,14 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
-import psutil
+from hotspot import collector
 from hotspot.common import bytes2human, right_text, title_text, tiny_font
 
 
 def render(draw, width, height):
-    mem = psutil.virtual_memory()
-    swap = psutil.swap_memory()
+    snap = collector.latest()
+    mem = snap["mem"]
+    swap = snap["swap"]
     mem_used_pct = (mem.total - mem.available) * 100.0 / mem.total
 
     margin = 3
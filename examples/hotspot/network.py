@@ -3,7 +3,7 @@
 # Copyright (c) 2014-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
-import psutil
+from hotspot import collector
 from hotspot.common import bytes2human, right_text, title_text, tiny_font
 
 
@@ -13,8 +13,9 @@ def stats(interface):
         margin = 3
         title_text(draw, margin, width, text="Net:{0}".format(interface))
         try:
-            address = psutil.net_if_addrs()[interface][0].address
-            counters = psutil.net_io_counters(pernic=True)[interface]
+            snap = collector.latest()
+            address = snap["net_addrs"][interface][0].address
+            counters = snap["net_io"][interface]
 
             draw.text((margin, 20), text=address, font=tiny_font, fill="white")
             draw.text((margin, 35), text="Rx:", font=tiny_font, fill="white")
@@ -16,142 +16,280 @@ try:
 except ImportError:
     SMBUS_AVAILABLE = False
 
+from PIL import Image, ImageDraw
+from luma.core.util import perf_counter
+from luma.core.virtual import snapshot
+from hotspot import collector
 from hotspot.common import right_text, title_text, tiny_font
-import time
+import atexit
+import struct
 
 
 # UPS Plus I2C configuration
 DEVICE_BUS = 1
 DEVICE_ADDR = 0x17
 
-# Cache for UPS data to reduce I2C reads
+# Register windows read from the UPS as (start, length) pairs:
+#   5-10  battery, Type C and Micro USB voltages (mV)
+#  19-20  remaining capacity (%)
+#  28-35  accumulated running and charged time (sec)
+_REGISTER_WINDOWS = ((5, 6), (19, 2), (28, 8))
+_REGISTER_COUNT = 36
+
+# Bus handle, opened once and reused between reads
+_bus = None
+
+# Whether the UPS is attached: None until it has either answered a read,
+# or the bus cannot be opened / it has failed _MAX_PROBE_FAILURES reads
+_ups_present = None
+_probe_failures = 0
+_MAX_PROBE_FAILURES = 3
+
+# Last good UPS reading, returned when the device cannot be read
 _ups_cache = None
-_ups_cache_time = 0
-_cache_validity = 1.5  # Cache valid for 1.5 seconds
+_poll_interval = 1.0  # Seconds between I2C reads
 
+# Pre-rendered label masks, see labels()
+_labels_cache = {}
 
-def read_ups_data():
+
+def _close_bus():
+    """Close the shared bus handle, if open."""
+    global _bus
+
+    bus, _bus = _bus, None
+    if bus is not None:
+        try:
+            bus.close()
+        except OSError:
+            pass
+
+
+atexit.register(_close_bus)
+
+
+def _supports(bus, func):
+    """Whether the bus adapter advertises func (assumed if unknown)."""
+    funcs = getattr(bus, "funcs", None)
+    return funcs is None or bool(funcs & getattr(smbus2.I2cFunc, func))
+
+
+def _read_registers(bus):
+    """
+    Read the register windows into a buffer indexed by register address,
+    using the fewest transactions the smbus2 version and adapter allow.
+    """
+    buf = bytearray(_REGISTER_COUNT)
+
+    if hasattr(smbus2, "i2c_msg") and _supports(bus, "I2C"):
+        # Fetch all the register windows in one combined I2C transaction:
+        # a register-select write followed by a block read for each window
+        msgs = []
+        for start, length in _REGISTER_WINDOWS:
+            msgs.append(smbus2.i2c_msg.write(DEVICE_ADDR, [start]))
+            msgs.append(smbus2.i2c_msg.read(DEVICE_ADDR, length))
+        bus.i2c_rdwr(*msgs)
+
+        for (start, length), msg in zip(_REGISTER_WINDOWS, msgs[1::2]):
+            buf[start:start + length] = bytes(msg)
+    elif _supports(bus, "SMBUS_READ_I2C_BLOCK"):
+        # SMBus-only adapters: one block read transaction per window
+        for start, length in _REGISTER_WINDOWS:
+            buf[start:start + length] = bytes(bus.read_i2c_block_data(DEVICE_ADDR, start, length))
+    else:
+        for start, length in _REGISTER_WINDOWS:
+            for i in range(start, start + length):
+                buf[i] = bus.read_byte_data(DEVICE_ADDR, i)
+
+    return buf
+
+
+def _read_ups_raw():
     """
     Read UPS battery data from I2C device.
-    Returns dict with battery info or None if unavailable.
-    Uses caching to reduce I2C traffic.
+    Returns dict with battery info, or the last good reading (None if
+    there is none yet) when the device cannot be read.
     """
-    global _ups_cache, _ups_cache_time
+    global _bus, _ups_cache, _ups_present, _probe_failures
 
-    # Return cached data if still valid
-    current_time = time.time()
-    if _ups_cache is not None and (current_time - _ups_cache_time) < _cache_validity:
+    # No smbus2, or no I2C bus or UPS on this host: nothing to read or retry
+    if not SMBUS_AVAILABLE or _ups_present is False:
         return _ups_cache
 
-    if not SMBUS_AVAILABLE:
-        return None
+    if _bus is None:
+        try:
+            _bus = smbus2.SMBus(DEVICE_BUS)
+        except OSError:
+            if _ups_present is None:
+                _ups_present = False
+            return _ups_cache
 
     try:
-        bus = smbus2.SMBus(DEVICE_BUS)
-
-        # Only read the specific registers we need (much faster than reading all 254)
-        # Registers we need: 5-6, 7-8, 9-10, 19-20, 28-31, 32-35
-        def read_register_range(start, end):
-            """Read a range of registers efficiently."""
-            result = []
-            for i in range(start, end + 1):
-                result.append(bus.read_byte_data(DEVICE_ADDR, i))
-            return result
-
-        # Read only necessary registers
-        bat_voltage = read_register_range(5, 6)
-        charge_typec = read_register_range(7, 8)
-        charge_micro = read_register_range(9, 10)
-        capacity = read_register_range(19, 20)
-        online_time = read_register_range(28, 31)
-        full_time = read_register_range(32, 35)
-
-        bus.close()
-
-        # Parse battery data from registers
+        buf = _read_registers(_bus)
+
+        # Decode the little-endian register values
+        bat_voltage, charge_typec, charge_micro = struct.unpack_from("<HHH", buf, 5)
+        capacity_pct, = struct.unpack_from("<H", buf, 19)
+        online_time, full_time = struct.unpack_from("<II", buf, 28)
+
         data = {
-            "capacity_pct": capacity[1] << 8
-            | capacity[0],  # Battery remaining capacity %
-            "online_time": online_time[3] << 24
-            | online_time[2] << 16
-            | online_time[1] << 8
-            | online_time[0],  # Accumulated running time (sec)
-            "full_time": full_time[3] << 24
-            | full_time[2] << 16
-            | full_time[1] << 8
-            | full_time[0],  # Accumulated charged time (sec)
-            "bat_voltage": bat_voltage[1] << 8
-            | bat_voltage[0],  # Battery port voltage (mV)
-            "charge_typec": charge_typec[1] << 8
-            | charge_typec[0],  # Type C charging voltage (mV)
-            "charge_micro": charge_micro[1] << 8
-            | charge_micro[0],  # Micro USB charging voltage (mV)
+            "capacity_pct": capacity_pct,  # Battery remaining capacity %
+            "online_time": online_time,  # Accumulated running time (sec)
+            "full_time": full_time,  # Accumulated charged time (sec)
+            "bat_voltage": bat_voltage,  # Battery port voltage (mV)
+            "charge_typec": charge_typec,  # Type C charging voltage (mV)
+            "charge_micro": charge_micro,  # Micro USB charging voltage (mV)
         }
 
-        # Update cache
+        # Update cache with a single reference swap, so readers on
+        # other threads never see a partial update
         _ups_cache = data
-        _ups_cache_time = current_time
+        _ups_present = True
 
         return data
 
-    except Exception as e:
+    except OSError:
+        # Drop the handle so that the next read reopens the bus, and
+        # return cached data if available, otherwise None
+        _close_bus()
+
+        # A device that has never answered is most likely not attached
+        if _ups_present is None:
+            _probe_failures += 1
+            if _probe_failures >= _MAX_PROBE_FAILURES:
+                _ups_present = False
+
+        return _ups_cache
+
+    except Exception:
         # Return cached data if available, otherwise None
         return _ups_cache
 
 
+def read_ups_data():
+    """
+    Return the latest UPS battery data, or None if unavailable.
+    The I2C reads happen on the shared collector thread, so this is
+    safe to call on every frame.
+    """
+    return collector.latest().get("ups")
+
+
+if SMBUS_AVAILABLE:
+    collector.register("ups", _read_ups_raw, interval=_poll_interval)
+
+
+def _format_minutes(mins):
+    if mins < 60:
+        return f"{mins}m"
+    return f"{mins // 60}h {mins % 60}m"
+
+
+# Preformatted strings for times up to 5 hours, which covers the runtime
+# estimate (at most 4h) and typical charge times
+_SECONDS_STR = tuple(f"{i}s" for i in range(60))
+_MINUTES_STR = tuple(_format_minutes(i) for i in range(5 * 60))
+
+
 def format_time(seconds):
     """Format seconds into human-readable time string."""
     if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        mins = seconds // 60
-        return f"{mins}m"
-    else:
-        hours = seconds // 3600
-        mins = (seconds % 3600) // 60
-        return f"{hours}h {mins}m"
+        return _SECONDS_STR[seconds]
+
+    mins = seconds // 60
+    if mins < len(_MINUTES_STR):
+        return _MINUTES_STR[mins]
+    return _format_minutes(mins)
+
+
+def display_values(data):
+    """
+    Return the (charge, status, time label, time) strings shown for the
+    given UPS data, or None if the UPS is not available.
+    """
+    if data is None:
+        return None
+
+    cap, tc, mc, ft = data["capacity_pct"], data["charge_typec"], data["charge_micro"], data["full_time"]
+
+    # Determine charging status
+    is_charging = max(tc, mc) > 4000
+
+    if is_charging:
+        # Accumulated charging time
+        return f"{cap}%", "Charging", "Charged:", format_time(ft)
+
+    # Calculate runtime estimate (rough estimate based on typical discharge)
+    # Assuming ~4 hours at 100% capacity, i.e. 4 * 3600 / 100 = 144s per %
+    runtime_seconds = cap * 144
+
+    return f"{cap}%", "On Batt", "Runtime:", format_time(runtime_seconds)
+
+
+def labels(draw, width, height, margin, text):
+    """
+    Return a mask of the static labels down the left-hand side, rasterised
+    once per label set so that redraws only need to render the values.
+    """
+    key = (draw.fontmode, width, height, margin, text)
+    mask = _labels_cache.get(key)
+    if mask is None:
+        mask = Image.new(draw.fontmode, (width, height))
+        mask_draw = ImageDraw.Draw(mask)
+        for y, label in zip((20, 35, 45), text):
+            mask_draw.text((margin, y), text=label, font=tiny_font, fill="white")
+        _labels_cache[key] = mask
+    return mask
 
 
 def render(draw, width, height):
     """Render UPS battery information."""
     margin = 5
 
-    data = read_ups_data()
+    values = display_values(read_ups_data())
 
-    if data is None:
+    title_text(draw, margin, width, text="UPS Battery")
+
+    if values is None:
         # UPS not available
-        title_text(draw, margin, width, text="UPS Battery")
-        draw.text((margin, 20), text="Status:", font=tiny_font, fill="white")
-        draw.text((margin, 35), text="UPS not", font=tiny_font, fill="white")
-        draw.text((margin, 45), text="detected", font=tiny_font, fill="white")
+        draw.bitmap((0, 0), labels(draw, width, height, margin, ("Status:", "UPS not", "detected")), fill="white")
         return
 
-    # Determine charging status
-    is_charging = data["charge_typec"] > 4000 or data["charge_micro"] > 4000
+    charge, status, time_label, time_text = values
 
-    # Calculate runtime estimate (rough estimate based on typical discharge)
-    # Assuming ~4 hours at 100% capacity
-    runtime_hours = (data["capacity_pct"] / 100.0) * 4.0
-    runtime_seconds = int(runtime_hours * 3600)
-
-    title_text(draw, margin, width, text="UPS Battery")
+    draw.bitmap((0, 0), labels(draw, width, height, margin, ("Charge:", "Status:", time_label)), fill="white")
 
     # Display battery percentage
-    draw.text((margin, 20), text="Charge:", font=tiny_font, fill="white")
-    right_text(draw, 20, width, margin, text=f"{data['capacity_pct']}%")
+    right_text(draw, 20, width, margin, text=charge)
 
-    if is_charging:
-        # Display charging status
-        draw.text((margin, 35), text="Status:", font=tiny_font, fill="white")
-        right_text(draw, 35, width, margin, text="Charging")
+    # Display charging status
+    right_text(draw, 35, width, margin, text=status)
 
-        # Display accumulated charging time
-        draw.text((margin, 45), text="Charged:", font=tiny_font, fill="white")
-        right_text(draw, 45, width, margin, text=format_time(data["full_time"]))
-    else:
-        # Display runtime remaining
-        draw.text((margin, 35), text="Status:", font=tiny_font, fill="white")
-        right_text(draw, 35, width, margin, text="On Batt")
+    # Display accumulated charging time or runtime remaining
+    right_text(draw, 45, width, margin, text=time_text)
+
+
+class UPSBattery(snapshot):
+    """
+    UPS battery snapshot that skips redrawing while the displayed values
+    are unchanged; the viewport keeps showing the previously drawn frame.
+    """
+
+    def __init__(self, width, height, interval=1.0):
+        super(UPSBattery, self).__init__(width, height, render, interval)
+        self._drawn = object()
+
+    def should_redraw(self):
+        if not super(UPSBattery, self).should_redraw():
+            return False
+
+        if display_values(read_ups_data()) == self._drawn:
+            # Nothing new to show: wait a full interval before checking again
+            self.last_updated = perf_counter()
+            return False
+
+        return True
 
-        draw.text((margin, 45), text="Runtime:", font=tiny_font, fill="white")
-        right_text(draw, 45, width, margin, text=format_time(runtime_seconds))
+    def update(self, draw):
+        self._drawn = display_values(read_ups_data())
+        super(UPSBattery, self).update(draw)
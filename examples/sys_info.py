@@ -99,7 +99,8 @@ def cpu_usage():
     hours, remainder = divmod(uptime.seconds, 3600)
     minutes, _ = divmod(remainder, 60)
 
-    cpu_percent = psutil.cpu_percent(interval=1)
+    # Non-blocking: usage since the previous call, i.e. over the last refresh
+    cpu_percent = psutil.cpu_percent(interval=None)
     return "CPU: %d%% Up: %dd%dh%dm" % (cpu_percent, days, hours, minutes)
 
 
@@ -154,6 +155,10 @@ def stats(device):
 
 
 def main():
+    # Prime the CPU usage counters, so the first reading is meaningful
+    psutil.cpu_percent(interval=None)
+    time.sleep(0.5)
+
     while True:
         stats(device)
         time.sleep(5)